@@ -7,23 +7,53 @@ license : MIT
 """
 
 # IMPORTS
-from PyQt5.Qt import (QApplication, QWidget, QSize, QThread, pyqtSignal, QLabel, QPushButton, Qt, QFrame, QPoint,
-                      QTimer, QIcon, QPixmap)
-
-from PyQt5.QtGui import QFont, QFontDatabase
+from PyQt5.QtCore import QSize, QThread, pyqtSignal, Qt, QPoint, QTimer
+from PyQt5.QtGui import QFont, QFontDatabase, QIcon, QPixmap
+from PyQt5.QtWidgets import QApplication, QWidget, QLabel, QPushButton, QFrame, QGridLayout
 from ProcessorPy import Processor, Sensors
-from time import sleep
+from updater import _is_process_running, _kill_process
+from time import monotonic
 from webbrowser import open as open_url
-import subprocess
-import requests
+from functools import partial
+from threading import Event
+from dataclasses import dataclass, field, fields
+import json
 import sys
 import os
 
+# Use the faster orjson parser and serializer when it's available
+try:
+    from orjson import loads as json_loads, dumps as json_dumps
+except ImportError:
+    from json import loads as json_loads
+
+    def json_dumps(obj) -> bytes:
+        """ This function will serialize the object to json bytes like orjson does"""
+        return json.dumps(obj).encode()
+
 # DEFINE GLOBAL VARIABLES
 AUTHOR: str = "Aymen Brahim Djelloul"
 VERSION: str = "1.0.1"
 DATE: str = "28.06.2024"
 
+# Define the App icons, they are decoded once at the first App construction
+_ICON_22: QPixmap | None = None
+_WIN_ICON: QIcon | None = None
+
+
+def _load_app_icons() -> tuple:
+    """ This function will decode and scale the App icon once and return the cached icons"""
+
+    global _ICON_22, _WIN_ICON
+
+    if _ICON_22 is None:
+        _ICON_22 = QPixmap("Assets/icon.ico").scaled(22, 22, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+        # Load the window icon from the file to keep all its sizes, a pixmap holds only one of them
+        _WIN_ICON = QIcon("Assets/icon.ico")
+
+    return _ICON_22, _WIN_ICON
+
 
 class App(QWidget):
     """
@@ -87,11 +117,26 @@ class App(QWidget):
 
     """
 
+    INFO_STYLE: str = """
+    QLabel[kind="info"] {
+        color: #000000;
+        background-color: #d7dadd;
+        weight: 500;
+        border: 1px;
+        border-radius: 3px;
+        border-color: #d7dadd;
+        padding: 2px;
+        }
+    """
+
     APP_FONT: str = ""
 
     def __init__(self):
         super(App, self).__init__(parent=None)
 
+        # Define the window drag state
+        self._move_pending: bool = False
+
         # Add Ubuntu font
         font_id = QFontDatabase.addApplicationFont("Assets\\Ubuntu-Regular.ttf")
 
@@ -102,39 +147,56 @@ class App(QWidget):
         else:
             self.APP_FONT: str = "Ubuntu"
 
-        # Create About and updater objects
+        # Create the App fonts once to reuse them for all widgets
+        self._f10 = QFont(self.APP_FONT, 10)
+        self._f11 = QFont(self.APP_FONT, 11)
+        self._f12 = QFont(self.APP_FONT, 12)
+        self._f13 = QFont(self.APP_FONT, 13)
+        self._ubuntu_f11 = QFont("Ubuntu", 11)
+
+        # Create About object
+        # NOTE : The Updater is created after the window is shown using 'start_update_check'
         self.about = About()
-        self.updater = Updater()
 
-        # Create Processor object
-        cpu = Processor()
+        # Create Processor object, its information is read by the worker outside the GUI thread
+        self.cpu = Processor()
         self.sensors = Sensors()
 
         # Create a worker to get cpu information
-        my_worker = Worker(cpu)
-        my_worker.result_ready.connect(self.get_cpu_info)
-        my_worker.start()
+        # NOTE : Keep a reference to it, a collected QThread would be destroyed while it's still running
+        self.cpu_worker = Worker(self.cpu)
+        self.cpu_worker.result_ready.connect(self.get_cpu_info)
+        self.cpu_worker.start()
+        QApplication.instance().aboutToQuit.connect(self.cpu_worker.wait)
 
         # Setup APP window
         self.setWindowTitle(f"ProcessorPy")
         self.setFixedSize(QSize(400, 520))
         self.setWindowFlags(Qt.FramelessWindowHint)
-        self.setWindowIcon(QIcon("Assets/icon.ico"))
+
+        # Set the info labels style once, labels opt in with the 'kind' property
+        self.setStyleSheet(self.INFO_STYLE)
+
+        icon_22, window_icon = _load_app_icons()
+        self.setWindowIcon(window_icon)
 
         # Create flags button
         # Create the exit button
         exit_button = QPushButton("X", self)
         exit_button.move(370, 5)
         exit_button.setCursor(Qt.PointingHandCursor)
-        exit_button.setFont(QFont(self.APP_FONT, 12))
+        exit_button.setFont(self._f12)
         exit_button.setStyleSheet(self.FLAG_BUTTON_STYLE)
-        exit_button.clicked.connect(sys.exit)
+        exit_button.clicked.connect(QApplication.quit)
+
+        # Stop the sensors worker before the application quits, whatever the way it quits
+        QApplication.instance().aboutToQuit.connect(self.stop_sensors_worker)
 
         # Create minimize button
         minimize_button = QPushButton("-", self)
         minimize_button.move(350, 5)
         minimize_button.setCursor(Qt.PointingHandCursor)
-        minimize_button.setFont(QFont(self.APP_FONT, 12))
+        minimize_button.setFont(self._f12)
         minimize_button.setStyleSheet(self.FLAG_BUTTON_STYLE)
         minimize_button.clicked.connect(self.showMinimized)
 
@@ -142,22 +204,21 @@ class App(QWidget):
         app_icon = QLabel(self)
         app_icon.move(5, 5)
 
-        pixmap = QPixmap("Assets/icon.ico").scaled(22, 22)
-        app_icon.setPixmap(pixmap)
+        app_icon.setPixmap(icon_22)
         app_icon.setStyleSheet("""
         border: 0;
         height: 10px;
         weight: 10px;
         """)
 
-        # Create label for cpu name
-        cpu_name = QPushButton(cpu.name, self)
-        cpu_name.move(10, 35)
-        cpu_name.setFont(QFont(self.APP_FONT, 12))
-        cpu_name.setObjectName("cpu_name")
-        cpu_name.setStyleSheet(self.STYLE)
-        cpu_name.setCursor(Qt.PointingHandCursor)
-        cpu_name.clicked.connect(self.cpu_name_clicked)
+        # Create label for cpu name, its text is set when the cpu information is ready
+        self.cpu_name = QPushButton("", self)
+        self.cpu_name.move(10, 35)
+        self.cpu_name.setFont(self._f12)
+        self.cpu_name.setObjectName("cpu_name")
+        self.cpu_name.setStyleSheet(self.STYLE)
+        self.cpu_name.setCursor(Qt.PointingHandCursor)
+        self.cpu_name.clicked.connect(self.cpu_name_clicked)
 
         # Create a horizontal line separator
         line = QFrame(self)
@@ -172,7 +233,7 @@ class App(QWidget):
         self.wait_label = QLabel("Please Wait..", self)
         self.wait_label.setObjectName("default_label")
         self.wait_label.setStyleSheet(self.STYLE)
-        self.wait_label.setFont(QFont(self.APP_FONT, 13))
+        self.wait_label.setFont(self._f13)
 
         # Move the label to the center
         self.wait_label.move(151, 239)
@@ -180,7 +241,7 @@ class App(QWidget):
         # Create About button
         about_button = QPushButton("About", self)
         about_button.move(15, 460)
-        about_button.setFont(QFont("Ubuntu", 11))
+        about_button.setFont(self._ubuntu_f11)
         about_button.setStyleSheet(self.BUTTON1_STYLE)
         about_button.setCursor(Qt.PointingHandCursor)
 
@@ -189,7 +250,7 @@ class App(QWidget):
         # Create Save button
         self.save_button = QPushButton("Save", self)
         self.save_button.move(90, 460)
-        self.save_button.setFont(QFont("Ubuntu", 11))
+        self.save_button.setFont(self._ubuntu_f11)
         self.save_button.setStyleSheet(self.BUTTON1_STYLE)
         self.save_button.clicked.connect(self.save)
         self.save_button.setCursor(Qt.PointingHandCursor)
@@ -201,7 +262,7 @@ class App(QWidget):
         # # Create more button
         # self.more_button = QPushButton("More", self)
         # self.more_button.move(320, 460)
-        # self.more_button.setFont(QFont("Ubuntu", 11))
+        # self.more_button.setFont(self._ubuntu_f11)
         # self.more_button.setStyleSheet(self.BUTTON1_STYLE)
         # self.more_button.setCursor(Qt.PointingHandCursor)
         # # self.more_button.clicked.connect()
@@ -211,116 +272,104 @@ class App(QWidget):
         self.old_pos = event.globalPos()
 
     def mouseMoveEvent(self, event):
+        # Store the latest position and move the window once per event loop turn
+        self._pending_pos = event.globalPos()
+
+        if not self._move_pending:
+            self._move_pending = True
+            QTimer.singleShot(0, self._flush_move)
+
+    def _flush_move(self):
+        """ This method will move the window to the latest dragged position"""
+
+        self._move_pending = False
         try:
-            delta = QPoint(event.globalPos() - self.old_pos)
+            delta = QPoint(self._pending_pos - self.old_pos)
             self.move(self.x() + delta.x(), self.y() + delta.y())
-            self.old_pos = event.globalPos()
+            self.old_pos = self._pending_pos
         except TypeError:
             pass
 
-    def get_cpu_info(self, cpu_info: dict):
+    def get_cpu_info(self, cpu_info: "CpuInfo"):
         """ This method will be connected to the worker to fill all information when it's ready"""
 
-        style: str = """
-        QLabel {
-            color: #000000;
-            background-color: #d7dadd;
-            weight: 500;
-            border: 1px;
-            border-radius: 3px;
-            border-color: #d7dadd;
-            padding: 2px;
-            }
-        """
-
-        self.cpu_info: dict = cpu_info
+        self.cpu_info: CpuInfo = cpu_info
 
         # Hide the please wait label
         self.wait_label.hide()
 
-        # Define x and y
-        x: int = 10
-        y: int = 80
+        # Set the cpu name, the worker has already read it
+        self.cpu_name.setText(self.cpu.name)
+        self.cpu_name.adjustSize()
 
-        # Iterate through dictionary to put cpu info
-        for k, v in cpu_info.items():
+        # Create the info table container
+        info_table = QWidget(self)
+        info_table.move(10, 80)
 
-            # Get the formatted string
-            formatted_string = f"{k} : {v}"
+        info_grid = QGridLayout(info_table)
+        info_grid.setContentsMargins(0, 0, 0, 0)
+        info_grid.setVerticalSpacing(5)
+
+        # Iterate through dictionary to put cpu info
+        for row, info_field in enumerate(fields(cpu_info)):
 
             # Create the info label
-            info_label = QLabel(formatted_string, self)
-            info_label.move(x, y)
-            info_label.setFont(QFont(self.APP_FONT, 11))
-            info_label.resize(QSize(260, 25))
-            # info_label.setObjectName("info_label")
-            info_label.setStyleSheet(style)
-            info_label.show()
+            info_label = QLabel(f"{info_field.metadata['label']} : {getattr(cpu_info, info_field.name)}", info_table)
+            info_label.setProperty("kind", "info")
+            info_label.setFont(self._f11)
+            info_label.setFixedSize(QSize(260, 25))
+            info_grid.addWidget(info_label, row, 0)
 
-            y += 30
+        info_table.show()
 
         # Create the sensors readings
         # Create the voltage sensor
-        voltage_label = QLabel(f"voltage : {self.sensors.get_cpu_voltage()}", self)
-        voltage_label.move(280, 80)
-        voltage_label.setFont(QFont(self.APP_FONT, 11))
-        voltage_label.resize(QSize(110, 25))
-        voltage_label.setStyleSheet(style)
-        voltage_label.show()
+        self.voltage_label = QLabel("voltage : ..", self)
+        self.voltage_label.setProperty("kind", "info")
+        self.voltage_label.move(280, 80)
+        self.voltage_label.setFont(self._f11)
+        self.voltage_label.resize(QSize(110, 25))
+        self.voltage_label.show()
 
         # Create the max clock speed sensor
-        self.clock_speed = QLabel(f"Speed : {self.sensors.get_cpu_clock_speed()}", self)
+        self.clock_speed = QLabel("Speed : ..", self)
+        self.clock_speed.setProperty("kind", "info")
         self.clock_speed.move(280, 110)
-        self.clock_speed.setFont(QFont(self.APP_FONT, 10))
+        self.clock_speed.setFont(self._f10)
         self.clock_speed.resize(QSize(110, 25))
-        self.clock_speed.setStyleSheet(style)
         self.clock_speed.show()
 
-        # Set a QTimer to update the clock speed label
-        # Set up the timer
-        # self.clock_speed_timer = QTimer(self)
-        # self.clock_speed_timer.timeout.connect(self.update_clock_speed)
-        # self.clock_speed_timer.start(1000)  # Update every 1000 milliseconds (1 second)
-
-        # Define empty list for labels to update
-        # labels: list = []
-
-        # # Iter through cores count
-        # y = 100
-        # for i in range(self.cpu_info["Cores"]):
-        #
-        #     # Create cores load sensor readings
-        #     core_load_label = QLabel(f"Core {i}: {self.sensors.get_cpu_usage(per_core=True)[i]}%", self)
-        #     core_load_label.move(280, y)
-        #     core_load_label.setFont(QFont("Ubuntu", 11))
-        #     core_load_label.resize(QSize(90, 25))
-        #     core_load_label.setStyleSheet(style)
-        #     core_load_label.show()
-        #
-        #     # Update the label
-        #     labels.append(core_load_label)
-        #
-        #     # Increase y
-        #     y += 30
-
         # Create total load sensor readings
-        self.total_load_label = QLabel(f"Total : {self.sensors.get_cpu_usage(per_core=False)}%", self)
+        self.total_load_label = QLabel("Total : ..%", self)
+        self.total_load_label.setProperty("kind", "info")
         self.total_load_label.move(280, 140)
-        self.total_load_label.setFont(QFont(self.APP_FONT, 10))
+        self.total_load_label.setFont(self._f10)
         self.total_load_label.resize(QSize(90, 25))
-        self.total_load_label.setStyleSheet(style)
         self.total_load_label.show()
 
-        # Set up the timer
-        self.cpu_load_timer = QTimer(self)
-        self.cpu_load_timer.timeout.connect(self.update_cpu_load)
-        self.cpu_load_timer.start(2000)  # Update every 1000 milliseconds (1 second)
+        # Start the sensors worker to read all sensors together outside the GUI thread
+        self.sensors_worker = SensorsWorker(self.sensors)
+        self.sensors_worker.result_ready.connect(self.apply_sensor_tick)
+        self.sensors_worker.start()
 
         # enable the save button
         self.save_button.setDisabled(False)
 
-        # Clear memory
-        del x, y, style, k, v, formatted_string, info_label
+    def stop_sensors_worker(self):
+        """ This method will stop the sensors worker and wait for its thread to finish"""
+
+        # The sensors worker is created only once the cpu information is ready
+        sensors_worker = getattr(self, "sensors_worker", None)
+        if sensors_worker is None:
+            return
+
+        # Setting the stop event wakes the worker from its interval wait, so it doesn't wait the tick out
+        sensors_worker.stop()
+        sensors_worker.wait()
+
+    def start_update_check(self):
+        """ This method will create the updater to check for new updates once the window is visible"""
+        self.updater = Updater()
 
     def cpu_name_clicked(self):
         """ This method will copy the cpu name to the clipboard"""
@@ -328,13 +377,29 @@ class App(QWidget):
     def save(self):
         """ This method will save the cpu information in text file"""
 
-    def update_clock_speed(self):
-        """ This method will update the current clock speed label"""
-        self.clock_speed.setText(f"Clock : {self.sensors.get_cpu_clock_speed()}")
+    def apply_sensor_tick(self, sensors_readings: dict):
+        """ This method will update the sensors labels with the latest readings"""
+        self.voltage_label.setText(f"voltage : {sensors_readings['voltage']}")
+        self.clock_speed.setText(f"Speed : {sensors_readings['clock_speed']}")
+        self.total_load_label.setText(f"Total : {sensors_readings['usage']}%")
+
 
-    def update_cpu_load(self):
-        """ This method will update the cpu label per core and total"""
-        self.total_load_label.setText(f"Total : {self.sensors.get_cpu_usage(per_core=False)}%")
+@dataclass(frozen=True, slots=True)
+class CpuInfo:
+    """ This class will hold the cpu information sent by the Worker, the 'label' metadata is the displayed name"""
+
+    manufacturer: str | None = field(metadata={"label": "Manufacturer"})
+    architecture: str | None = field(metadata={"label": "Architecture"})
+    family: str | None = field(metadata={"label": "Family"})
+    stepping: str | None = field(metadata={"label": "Stepping"})
+    socket: str | None = field(metadata={"label": "Socket"})
+    l1_cache: str | int | None = field(metadata={"label": "L1 Cache"})
+    l2_cache: str | int | None = field(metadata={"label": "L2 Cache"})
+    l3_cache: str | int | None = field(metadata={"label": "L3 Cache"})
+    max_clock_speed: str | float | None = field(metadata={"label": "Max clock speed"})
+    cores: int | None = field(metadata={"label": "Cores"})
+    threads: int | None = field(metadata={"label": "Threads"})
+    virtualization: str = field(metadata={"label": "Virtualization"})
 
 
 # Define the Worker class
@@ -344,37 +409,151 @@ class Worker(QThread):
 
     """
 
-    result_ready = pyqtSignal(dict)
+    result_ready = pyqtSignal(object)
 
     def __init__(self, cpu_obj):
         super(Worker, self).__init__()
         self.cpu_obj = cpu_obj
 
     def run(self):
-        """ This method will get the cpu information using threading to prevent program lag"""
-
-        cpu_info: dict = {
-            "Manufacturer": self.cpu_obj.manufacturer,
-            "Architecture": self.cpu_obj.architecture,
-            "Family": self.cpu_obj.family,
-            "Stepping": self.cpu_obj.stepping(),
-            "Socket": self.cpu_obj.socket,
-            "L1 Cache": self.cpu_obj.l1_cache_size(),
-            "L2 Cache": self.cpu_obj.l2_cache_size(),
-            "L3 Cache": self.cpu_obj.l3_cache_size(),
-            "Max clock speed": self.cpu_obj.max_clock_speed(),
-            "Cores": self.cpu_obj.core_count(),
-            "Threads": self.cpu_obj.core_count(logical=True),
-        }
-        # Get if the cpu support virtualization
-        if self.cpu_obj.is_support_virtualization():
-            cpu_info.update({"Virtualization": "YES"})
-        else:
-            cpu_info.update({"Virtualization": "NO"})
+        """ This method will get the cpu information outside the GUI thread to prevent program lag"""
+
+        cpu_info = CpuInfo(
+            manufacturer=self.cpu_obj.manufacturer,
+            architecture=self.cpu_obj.architecture,
+            family=self.cpu_obj.family,
+            stepping=self.cpu_obj.stepping(),
+            socket=self.cpu_obj.socket,
+            l1_cache=self.cpu_obj.l1_cache_size(),
+            l2_cache=self.cpu_obj.l2_cache_size(),
+            l3_cache=self.cpu_obj.l3_cache_size(),
+            max_clock_speed=self.cpu_obj.max_clock_speed(),
+            cores=self.cpu_obj.core_count(),
+            threads=self.cpu_obj.core_count(logical=True),
+            virtualization="YES" if self.cpu_obj.is_support_virtualization() else "NO",
+        )
 
         self.result_ready.emit(cpu_info)
 
 
+class SensorsWorker(QThread):
+    """
+
+
+    """
+
+    result_ready = pyqtSignal(dict)
+
+    # Define the sensors refresh interval in milliseconds
+    INTERVAL: int = 2000
+
+    def __init__(self, sensors_obj):
+        super(SensorsWorker, self).__init__()
+        self.sensors_obj = sensors_obj
+
+        # Define the stop event, waiting on it lets stop() end the loop without waiting the interval out
+        self._stop_event = Event()
+
+    def run(self):
+        """ This method will read all the sensors together on each tick and emit them in one signal"""
+
+        # Bind the loop callables once instead of looking them up on each tick
+        emit = self.result_ready.emit
+        get_voltage = self.sensors_obj.get_cpu_voltage
+        get_clock_speed = self.sensors_obj.get_cpu_clock_speed
+        get_usage = partial(self.sensors_obj.get_cpu_usage, per_core=False)
+
+        # Schedule the ticks on fixed deadlines so the readings time doesn't drift the interval
+        next_tick: float = monotonic()
+
+        while not self._stop_event.is_set():
+            emit({
+                "voltage": get_voltage(),
+                "clock_speed": get_clock_speed(),
+                "usage": get_usage(),
+            })
+
+            next_tick += self.INTERVAL / 1000
+            delay: float = next_tick - monotonic()
+
+            if delay > 0:
+                self._stop_event.wait(delay)
+            else:
+                # The readings took longer than the interval, start again from now instead of bursting
+                next_tick = monotonic()
+
+    def stop(self):
+        """ This method will stop the sensors readings loop"""
+        self._stop_event.set()
+
+
+class UpdateCheckWorker(QThread):
+    """
+
+
+    """
+
+    result_ready = pyqtSignal(dict)
+
+    RELEASES_URL: str = "https://api.github.com/repos/aymenbrahimdjelloul/ProcessorPy/releases/latest"
+    CACHE_PATH: str = os.path.join(os.getenv("APPDATA", os.path.expanduser("~")), "ProcessorPy", "release.json")
+
+    def run(self):
+        """ This method will request the latest release data using the cached ETag to prevent re-downloading it"""
+
+        # Import requests only when the update check runs, it's heavy and not needed to show the cpu info
+        import requests
+
+        cached_release: dict = self.__load_cache()
+        headers: dict = {"If-None-Match": cached_release["etag"]} if cached_release.get("etag") else {}
+
+        try:
+            r = requests.get(self.RELEASES_URL, headers=headers, timeout=10)
+
+            # The release didn't change since the last check
+            if r.status_code == 304:
+                self.result_ready.emit(cached_release)
+                return
+
+            r.raise_for_status()
+            data: dict = json_loads(r.content)
+
+            release: dict = {
+                "etag": r.headers.get("ETag"),
+                "tag_name": data["tag_name"],
+                "size": data["assets"][0]["size"],
+            }
+
+        # Error Handling
+        except (requests.RequestException, KeyError, IndexError, ValueError):
+            self.result_ready.emit({})
+            return
+
+        self.__save_cache(release)
+        self.result_ready.emit(release)
+
+    def __load_cache(self) -> dict:
+        """ This method will load the cached latest release data"""
+
+        try:
+            with open(self.CACHE_PATH, 'rb') as file:
+                return json_loads(file.read())
+
+        except (OSError, ValueError):
+            return {}
+
+    def __save_cache(self, release: dict):
+        """ This method will save the latest release data with its ETag"""
+
+        try:
+            os.makedirs(os.path.dirname(self.CACHE_PATH), exist_ok=True)
+            with open(self.CACHE_PATH, 'wb') as file:
+                file.write(json_dumps(release))
+
+        except OSError:
+            pass
+
+
 class About(QLabel):
 
     style = """
@@ -424,9 +603,18 @@ class About(QLabel):
 
     def __init__(self):
         super(About, self).__init__(parent=None)
+
+        # Define the window drag state
+        self._move_pending: bool = False
         # hide it
         self.hide()
 
+        # Create the About fonts once to reuse them for all widgets
+        self._f10 = QFont("Ubuntu", 10)
+        self._f11 = QFont("Ubuntu", 11)
+        self._f12 = QFont("Ubuntu", 12)
+        self._f14 = QFont("Ubuntu", 14)
+
         # set about widget
         self.setStyleSheet(self.style)
         self.setFixedSize(QSize(350, 380))
@@ -437,7 +625,7 @@ class About(QLabel):
         exit_button = QPushButton("X", self)
         exit_button.move(315, 10)
         exit_button.setCursor(Qt.PointingHandCursor)
-        exit_button.setFont(QFont("Ubuntu", 12))
+        exit_button.setFont(self._f12)
         exit_button.setStyleSheet(App.FLAG_BUTTON_STYLE)
         exit_button.clicked.connect(self.hide)
 
@@ -445,8 +633,7 @@ class About(QLabel):
         self.logo = QLabel('ProcessorPy', self)
         self.logo.setObjectName('logo')
         self.logo.move(15, 20)
-        self.logo.setFont(QFont('Ubuntu', 14))
-        self.logo.setStyleSheet(self.style)
+        self.logo.setFont(self._f14)
         self.logo.adjustSize()
 
         # Developed by
@@ -454,40 +641,34 @@ class About(QLabel):
         self.developed_by.setObjectName('others')
         self.developed_by.setText(f"Developed by {AUTHOR}")
         self.developed_by.move(20, 80)
-        self.developed_by.setFont(QFont('Ubuntu', 10))
-        self.developed_by.setStyleSheet(self.style)
+        self.developed_by.setFont(self._f10)
 
         # build label
         self.license = QLabel(self)
         self.license.setObjectName('others')
         self.license.setText(f"built on {DATE}")
         self.license.move(20, 115)
-        self.license.setFont(QFont('Ubuntu', 10))
-
-        self.license.setStyleSheet(self.style)
+        self.license.setFont(self._f10)
 
         # runtime version
         self.version = QLabel(self)
         self.version.setObjectName('others')
         self.version.setText(f"Runtime version : {VERSION}")
         self.version.move(20, 180)
-        self.version.setFont(QFont('Ubuntu', 10))
-        self.version.setStyleSheet(self.style)
+        self.version.setFont(self._f10)
 
         # copyright all right reserved label
         self.copyright = QLabel(self)
         self.copyright.setObjectName('others')
         self.copyright.setText('All Copyright © are reserved under\n MIT License')
         self.copyright.move(20, 210)
-        self.copyright.setFont(QFont('Ubuntu', 10))
-        self.copyright.setStyleSheet(self.style)
+        self.copyright.setFont(self._f10)
 
         # contact me button
         self.contact_me_btn = QPushButton('Contact Me', self)
         self.contact_me_btn.setObjectName('contactBtn')
         self.contact_me_btn.move(100, 320)
-        self.contact_me_btn.setStyleSheet(self.style)
-        self.contact_me_btn.setFont(QFont('Ubuntu', 10))
+        self.contact_me_btn.setFont(self._f10)
         self.contact_me_btn.setCursor(Qt.PointingHandCursor)
         self.contact_me_btn.clicked.connect(
             lambda: open_url('https://github.com/aymenbrahimdjelloul'))
@@ -496,8 +677,7 @@ class About(QLabel):
         self.github_repo_btn = QPushButton('GitHub', self)
         self.github_repo_btn.setObjectName('githubBtn')
         self.github_repo_btn.move(15, 320)
-        self.github_repo_btn.setStyleSheet(self.style)
-        self.github_repo_btn.setFont(QFont('Ubuntu', 11))
+        self.github_repo_btn.setFont(self._f11)
         self.github_repo_btn.setCursor(Qt.PointingHandCursor)
         self.github_repo_btn.clicked.connect(
             lambda: open_url('https://github.com/aymenbrahimdjelloul/ProcessorPy'))
@@ -507,10 +687,21 @@ class About(QLabel):
         self.old_pos = event.globalPos()
 
     def mouseMoveEvent(self, event):
+        # Store the latest position and move the window once per event loop turn
+        self._pending_pos = event.globalPos()
+
+        if not self._move_pending:
+            self._move_pending = True
+            QTimer.singleShot(0, self._flush_move)
+
+    def _flush_move(self):
+        """ This method will move the window to the latest dragged position"""
+
+        self._move_pending = False
         try:
-            delta = QPoint(event.globalPos() - self.old_pos)
+            delta = QPoint(self._pending_pos - self.old_pos)
             self.move(self.x() + delta.x(), self.y() + delta.y())
-            self.old_pos = event.globalPos()
+            self.old_pos = self._pending_pos
         except TypeError:
             pass
 
@@ -521,6 +712,10 @@ class Updater(QWidget):
     IS_UP_TO_DATE: bool
 
     STYLE: str = """
+    QWidget {
+        background-color: #DCDDDD;
+    }
+
     QLabel {
         color: #4E4D4D;
         weight: 500;
@@ -545,84 +740,90 @@ class Updater(QWidget):
     def __init__(self):
         super(Updater, self).__init__(parent=None)
 
+        # Define the window drag state
+        self._move_pending: bool = False
+
         # Set up the Updater window
         self.setFixedSize(QSize(500, 120))
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
-        self.setStyleSheet("background-color: #DCDDDD;")
-
-        try:
-            # Check the latest release version
-            if self.is_up_to_date():
-                # If the App is Up-to-date kill it
-                self.hide()
-                self.deleteLater()
 
-                # delete defined variables
-                del self.REQUEST_DATA
+        # Set the style once for the Updater and all its widgets
+        self.setStyleSheet(self.STYLE)
 
-            else:
-                # Otherwise ask the user to download latest version
-                self.setup_update()
-
-        # Error Handling
-        except requests.RequestException:
-            self.hide()
-            self.deleteLater()
+        # Check for the latest release outside the GUI thread
+        self.update_check_worker = UpdateCheckWorker()
+        self.update_check_worker.result_ready.connect(self.on_update_checked)
+        self.update_check_worker.start()
 
-            # delete defined variables
-            del self.REQUEST_DATA
+        # Wait for the release request before quitting, it may still be in flight up to its timeout
+        QApplication.instance().aboutToQuit.connect(self.update_check_worker.wait)
 
     def mousePressEvent(self, event):
         self.old_pos = event.globalPos()
 
     def mouseMoveEvent(self, event):
+        # Store the latest position and move the window once per event loop turn
+        self._pending_pos = event.globalPos()
+
+        if not self._move_pending:
+            self._move_pending = True
+            QTimer.singleShot(0, self._flush_move)
+
+    def _flush_move(self):
+        """ This method will move the window to the latest dragged position"""
+
+        self._move_pending = False
         try:
-            delta = QPoint(event.globalPos() - self.old_pos)
+            delta = QPoint(self._pending_pos - self.old_pos)
             self.move(self.x() + delta.x(), self.y() + delta.y())
-            self.old_pos = event.globalPos()
+            self.old_pos = self._pending_pos
         except TypeError:
             pass
 
-    def is_up_to_date(self) -> bool:
-        """ This method will connect and check for new updates"""
+    def on_update_checked(self, release_data: dict):
+        """ This method will be connected to the update check worker when the latest release data is ready"""
 
-        # Get the current version
-        current_version: str = f"v{VERSION}"
+        # Store the latest release data
+        self.REQUEST_DATA = release_data
 
-        # Get the latest release version
-        # Get a request
-        r = requests.get("https://api.github.com/repos/aymenbrahimdjelloul/ProcessorPy/releases/latest").json()
-        latest_release: str = r["tag_name"]
+        # If the App is Up-to-date or the request failed kill it
+        if not release_data or self.is_up_to_date():
+            self.hide()
+            self.deleteLater()
 
-        # Store request data
-        self.REQUEST_DATA = r
+        else:
+            # Otherwise ask the user to download latest version
+            self.setup_update()
 
-        return True if current_version == latest_release else False
+    def is_up_to_date(self) -> bool:
+        """ This method will check if the current version is the latest release"""
+        return f"v{VERSION}" == self.REQUEST_DATA["tag_name"]
 
     def setup_update(self):
         """ This method will set up the update widget"""
 
+        # Create the Updater fonts once to reuse them for all widgets
+        self._f10 = QFont("Ubuntu", 10)
+        self._f11 = QFont("Ubuntu", 11)
+
         # Create Updater label
         self.update_label = QLabel(f"New update available! Please download the latest version."
                               f" {self.REQUEST_DATA['tag_name']}\n\n"
-                              f" Download size : {self.bytes_to_megabytes(self.REQUEST_DATA['assets'][0]['size'])} Mb", self)
-        self.update_label.setFont(QFont("Ubuntu", 11))
+                              f" Download size : {self.REQUEST_DATA['size'] >> 20} Mb", self)
+        self.update_label.setFont(self._f11)
         self.update_label.move(10, 20)
-        self.update_label.setStyleSheet(self.STYLE)
 
         # Create Cancel button
         self.cancel_button = QPushButton("Cancel", self)
         self.cancel_button.move(15, 80)
-        self.cancel_button.setStyleSheet(self.STYLE)
-        self.cancel_button.setFont(QFont("Ubuntu", 11))
+        self.cancel_button.setFont(self._f11)
         self.cancel_button.setCursor(Qt.PointingHandCursor)
         self.cancel_button.clicked.connect(self.cancel_update)
 
         # Create Install now button
         self.install_button = QPushButton("Install Now", self)
         self.install_button.move(110, 80)
-        self.install_button.setStyleSheet(self.STYLE)
-        self.install_button.setFont(QFont("Ubuntu", 10))
+        self.install_button.setFont(self._f10)
         self.install_button.setCursor(Qt.PointingHandCursor)
         self.install_button.clicked.connect(self.update_app)
 
@@ -639,8 +840,6 @@ class Updater(QWidget):
         if self.__is_process_running():
             # Kill 'updater.exe' process
             self.__kill_processor_py_process()
-            # Delete the downloaded data zip file
-            os.system("rm data.zip")
 
     def update_app(self):
         """ This method will download and install the new version """
@@ -663,30 +862,14 @@ class Updater(QWidget):
         self.update_label.setStyleSheet("color: #308578;")
 
     @staticmethod
-    def bytes_to_megabytes(num: int) -> int:
-        """ This method will convert the given bytes to megabytes """
-        return num // 1048576
-
-    @staticmethod
-    def __is_process_running(process_name: str = "updater") -> bool:
+    def __is_process_running(process_name: str = "updater.exe") -> bool:
         """
-        This function will detect if the 'ProcessorPy' process is running or not
+        This function will detect if the 'updater' process is running or not
 
         :param: 'process_name'
         :return: bool
         """
-
-        try:
-            # Run the 'tasklist' command to get the list of running processes
-            output = subprocess.check_output(['tasklist'], universal_newlines=True)
-            # Check if the process name is in the output
-            if process_name in output:
-                return True
-            else:
-                return False
-        except subprocess.CalledProcessError as e:
-            # print(f"An error occurred: {e}")
-            return False
+        return _is_process_running(process_name)
 
     @staticmethod
     def __kill_processor_py_process(process_name: str = "updater.exe") -> int:
@@ -696,27 +879,7 @@ class Updater(QWidget):
            :param process_name: Name of the process to kill.
            :return: PID of the killed process if successful, -1 otherwise.
            """
-        try:
-            # Find the PID of the process
-            result = subprocess.check_output(['tasklist', '/FI', f'IMAGENAME eq {process_name}'],
-                                             universal_newlines=True)
-
-            # Parse the output to get the PID
-            for line in result.splitlines():
-                if process_name in line:
-                    # Extract PID (assuming the PID is the second column in the output)
-                    pid = int(line.split()[1])
-
-                    # Kill the process using the PID
-                    subprocess.run(['taskkill', '/PID', str(pid), '/F'], check=True)
-                    print(f"Process {process_name} with PID {pid} has been killed.")  # For Debugging
-                    return pid
-
-            # If process name is not found in the output
-            print(f"Process {process_name} not found.")  # For Debugging
-            return -1
-        except subprocess.CalledProcessError as e:
-            print(f"An error occurred: {e}")  # For Debugging
+        return _kill_process(process_name)
 
 
 if __name__ == "__main__":
@@ -725,4 +888,7 @@ if __name__ == "__main__":
     _window = App()
     _window.show()
 
+    # Check for updates after the window is painted
+    QTimer.singleShot(0, _window.start_update_check)
+
     sys.exit(app.exec_())
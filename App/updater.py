@@ -28,11 +28,108 @@ Operational Notes:
 # IMPORTS
 import sys
 import os
-import requests
 import zipfile
-import subprocess
+import io
+import ctypes
+from ctypes import wintypes
 from time import sleep
 
+# Use the faster orjson parser when it's available
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Define the update download chunk size
+DOWNLOAD_CHUNK_SIZE: int = 1 << 20
+
+# Define the network requests timeout in seconds
+REQUEST_TIMEOUT: int = 30
+
+# Define Win32 API constants
+TH32CS_SNAPPROCESS: int = 0x00000002
+PROCESS_TERMINATE: int = 0x0001
+INVALID_HANDLE_VALUE: int = -1
+
+
+class PROCESSENTRY32W(ctypes.Structure):
+    """ This structure describes an entry from the processes snapshot list"""
+
+    _fields_ = [
+        ("dwSize", wintypes.DWORD),
+        ("cntUsage", wintypes.DWORD),
+        ("th32ProcessID", wintypes.DWORD),
+        ("th32DefaultHeapID", ctypes.c_size_t),
+        ("th32ModuleID", wintypes.DWORD),
+        ("cntThreads", wintypes.DWORD),
+        ("th32ParentProcessID", wintypes.DWORD),
+        ("pcPriClassBase", ctypes.c_long),
+        ("dwFlags", wintypes.DWORD),
+        ("szExeFile", ctypes.c_wchar * wintypes.MAX_PATH),
+    ]
+
+
+# Define the processes native functions prototypes once on a private kernel32 instance,
+# to not change the shared 'windll.kernel32' one and not let ctypes guess the handles types.
+# The App imports this module at startup on all the platforms, kernel32 only exists on Windows
+if sys.platform == "win32":
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    _kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    _kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+
+    _kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    _kernel32.Process32FirstW.restype = wintypes.BOOL
+
+    _kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    _kernel32.Process32NextW.restype = wintypes.BOOL
+
+    _kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    _kernel32.OpenProcess.restype = wintypes.HANDLE
+
+    _kernel32.TerminateProcess.argtypes = [wintypes.HANDLE, wintypes.UINT]
+    _kernel32.TerminateProcess.restype = wintypes.BOOL
+
+    _kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    _kernel32.CloseHandle.restype = wintypes.BOOL
+
+
+def _find_process_ids(process_name: str) -> list:
+    """
+    This function will enumerate the running processes using the Win32 API and return the matched PIDs
+
+    :param process_name: Name of the process executable to find.
+    :return: list of the matched processes PIDs
+    """
+
+    # Take a snapshot of all running processes
+    snapshot = _kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if snapshot is None or snapshot == ctypes.c_void_p(INVALID_HANDLE_VALUE).value:
+        return []
+
+    # Define the matched process names
+    process_name = process_name.lower()
+    process_ids: list = []
+
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+
+        # Iterate through the processes snapshot
+        found = _kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while found:
+
+            if entry.szExeFile.lower() in (process_name, f"{process_name}.exe"):
+                process_ids.append(entry.th32ProcessID)
+
+            found = _kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+
+    finally:
+        _kernel32.CloseHandle(snapshot)
+
+    return process_ids
+
+
 def _is_process_running(process_name: str = "ProcessorPy") -> bool:
     """
     This function will detect if the 'ProcessorPy' process is running or not
@@ -40,27 +137,57 @@ def _is_process_running(process_name: str = "ProcessorPy") -> bool:
     :param: 'process_name'
     :return: bool
     """
+    return len(_find_process_ids(process_name)) > 0
 
-    try:
-        # Run the 'tasklist' command to get the list of running processes
-        output = subprocess.check_output(['tasklist'], universal_newlines=True)
-        # Check if the process name is in the output
-        if process_name in output:
-            return True
-        else:
-            return False
-    except subprocess.CalledProcessError as e:
-        # print(f"An error occurred: {e}")
-        return False
+
+def _kill_process(process_name: str) -> int:
+    """
+       This function will kill the specified process by name and return its PID.
+
+       :param process_name: Name of the process to kill.
+       :return: PID of the killed process if successful, -1 otherwise.
+       """
+
+    for pid in _find_process_ids(process_name):
+
+        # Open the process with terminate access right
+        handle = _kernel32.OpenProcess(PROCESS_TERMINATE, False, pid)
+        if not handle:
+            continue
+
+        try:
+            # Kill the process using the PID
+            if _kernel32.TerminateProcess(handle, 1):
+                print(f"Process {process_name} with PID {pid} has been killed.")  # For Debugging
+                return pid
+        finally:
+            _kernel32.CloseHandle(handle)
+
+    # If process name is not found in the running processes
+    print(f"Process {process_name} not found.")  # For Debugging
+    return -1
 
 
 class Updater:
 
     def __init__(self):
 
+        # Import requests only when an update is going to be installed, the App imports this module at startup
+        import requests
+
         # Make a request to get the latest update data
-        self.UPDATE_DATA = requests.get(
-            "https://api.github.com/repos/aymenbrahimdjelloul/ProcessorPy/releases/latest").json()
+        data: dict = json_loads(requests.get(
+            "https://api.github.com/repos/aymenbrahimdjelloul/ProcessorPy/releases/latest",
+            timeout=REQUEST_TIMEOUT).content)
+
+        # Keep only the needed fields
+        self.UPDATE_DATA: dict = {
+            "tag_name": data["tag_name"],
+            "assets": [{
+                "size": data["assets"][0]["size"],
+                "browser_download_url": data["assets"][0]["browser_download_url"],
+            }],
+        }
 
         # Define variables
         self.download_link: str = self.UPDATE_DATA['assets'][0]['browser_download_url']
@@ -70,7 +197,7 @@ class Updater:
 
         # Download the update data
         print("Downloading..")  # For Debugging
-        # self.download_update(self.download_link, os.getcwd())
+        update_data = self.download_update(self.download_link)
 
         # Kill the previous ProcessorPy App
         self.__kill_processor_py_process()
@@ -85,40 +212,43 @@ class Updater:
 
         # Extract the downloaded data
         print("unzip..")   # For Debugging
-        self.__extract_data("data.zip", os.getcwd())
+        self.__extract_data(update_data, os.getcwd())
 
         # Restart the App
         self.__restart_processor_py()
 
         print("update finished !")      # For debugging
 
-        # Remove the downloaded data
-        os.system("rm data.zip")
         # input()     # For Debugging
         # Exit the updater
         sys.exit([])
 
     @staticmethod
-    def download_update(download_url: str, path: str):
-        """ This method will download the update data"""
+    def download_update(download_url: str) -> io.BytesIO:
+        """ This method will download the update data in memory"""
+
+        import requests
+
+        buffer = io.BytesIO()
 
-        #
-        with requests.get(download_url, stream=True) as r:
+        with requests.get(download_url, stream=True, timeout=REQUEST_TIMEOUT) as r:
             r.raise_for_status()
-            with open(f"{path}\\data.zip", 'wb') as f:
-                for chunk in r.iter_content(chunk_size=8192):
-                    f.write(chunk)
 
-        # Clear memory
-        del r, f, chunk
+            # 'iter_content' decodes the gzip or deflate content encoding of the response
+            for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                buffer.write(chunk)
+
+        # Rewind the buffer to let it be read from the start
+        buffer.seek(0)
+        return buffer
 
     @staticmethod
-    def __extract_data(zip_path: str, extract_to: str):
+    def __extract_data(zip_file: io.BytesIO | str, extract_to: str):
         """
         Extracts the contents of a ZIP file to a specified location.
 
         Parameters:
-        zip_path (str): The path to the ZIP file.
+        zip_file (io.BytesIO | str): The downloaded ZIP data or the path to the ZIP file.
         extract_to (str): The directory where the contents should be extracted.
 
         Raises:
@@ -127,9 +257,9 @@ class Updater:
         PermissionError: If there are permission issues accessing the file or directory.
         """
 
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        with zipfile.ZipFile(zip_file, 'r') as zip_ref:
             zip_ref.extractall(extract_to)
-        print(f"Extracted all contents of {zip_path} to {extract_to}")
+        print(f"Extracted all contents of the update data to {extract_to}")
 
         # except FileNotFoundError as fnf_error:
         #     print(fnf_error)
@@ -149,27 +279,7 @@ class Updater:
            :param process_name: Name of the process to kill.
            :return: PID of the killed process if successful, -1 otherwise.
            """
-        try:
-            # Find the PID of the process
-            result = subprocess.check_output(['tasklist', '/FI', f'IMAGENAME eq {process_name}'],
-                                             universal_newlines=True)
-
-            # Parse the output to get the PID
-            for line in result.splitlines():
-                if process_name in line:
-                    # Extract PID (assuming the PID is the second column in the output)
-                    pid = int(line.split()[1])
-
-                    # Kill the process using the PID
-                    subprocess.run(['taskkill', '/PID', str(pid), '/F'], check=True)
-                    print(f"Process {process_name} with PID {pid} has been killed.")  # For Debugging
-                    return pid
-
-            # If process name is not found in the output
-            print(f"Process {process_name} not found.")  # For Debugging
-            return -1
-        except subprocess.CalledProcessError as e:
-            print(f"An error occurred: {e}")  # For Debugging
+        return _kill_process(process_name)
 
     @staticmethod
     def __restart_processor_py():
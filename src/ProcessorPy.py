@@ -10,17 +10,17 @@ License : MIT
 
 """
 
-from platform import system
+import sys
 from exceptions import *
 
 
 if __name__ != "__main__":
 
-    if system() == "Windows":
+    if sys.platform.startswith("win"):
         from __Windows_ProcessorPy import Processor, Sensors
 
-    elif system() == "Linux":
+    elif sys.platform.startswith("linux"):
         from __Linux_ProcessorPy import Processor, Sensors
 
     else:
-        raise NotSupportedPlatform(system())
+        raise NotSupportedPlatform(sys.platform)
@@ -7,114 +7,254 @@ license : MIT
 
 sources :
     - https://www.tecmint.com/check-linux-cpu-information/
-    - https://www.javatpoint.com/linux-top
-    - https://www.geeksforgeeks.org/top-command-in-linux-with-examples/
+    - https://www.kernel.org/doc/html/latest/filesystems/proc.html
+    - https://www.kernel.org/doc/Documentation/ABI/testing/sysfs-devices-system-cpu
+    - https://www.kernel.org/doc/html/latest/admin-guide/pm/cpufreq.html
 
 
 """
 # IMPORTS
-import re
-import os.path
+import os
+import platform
 import time
-import subprocess
-from __ProcessorPy_core import ProcessorPyCore, sys, cpu_count, ceil
+from functools import cached_property
+from __ProcessorPy_core import ProcessorPyCore, sys, cpu_count
 from exceptions import SystemDriverDoesntError
 
+# Define the kernel cpu information paths
+CPUINFO_PATH: str = "/proc/cpuinfo"
+STAT_PATH: str = "/proc/stat"
+CPU_SYSFS_PATH: str = "/sys/devices/system/cpu/cpu0"
+CPU_MSR_PATH: str = "/dev/cpu/0/msr"
+
+# Define the actual and maximum performance counters MSR addresses
+IA32_MPERF: int = 0xE7
+IA32_APERF: int = 0xE8
+
+# Define the cpu flags which mean the virtualization is supported,
+# 'vmx' is Intel VT-x, 'svm' is AMD-V and 'hypervisor' is set when running under a hypervisor
+VIRTUALIZATION_FLAGS: frozenset = frozenset(("vmx", "svm", "hypervisor"))
+
+# Define the ARM cpu implementers names by their 'CPU implementer' code, like lscpu does
+ARM_IMPLEMENTERS: dict = {
+    0x41: "ARM", 0x42: "Broadcom", 0x43: "Cavium", 0x46: "Fujitsu", 0x48: "HiSilicon", 0x4E: "NVIDIA",
+    0x50: "APM", 0x51: "Qualcomm", 0x53: "Samsung", 0x56: "Marvell", 0x61: "Apple", 0x69: "Intel",
+    0xC0: "Ampere",
+}
+
+# Define the kernel files descriptors which are kept open across the sensors readings
+_SYS_FDS: dict = {}
+
+
+def _read_sys_file(path: str) -> str | None:
+    """ This function will read a kernel info file and return its stripped content"""
+
+    try:
+        with open(path, 'r') as file:
+            return file.read().strip()
+
+    except OSError:
+        return None
+
+
+def _get_sys_fd(path: str) -> int | None:
+    """ This function will return a kept open descriptor of a kernel file, it's opened once at the first use"""
+
+    try:
+        return _SYS_FDS[path]
+
+    except KeyError:
+        pass
+
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+
+    # Remember the missing or unreadable files too, to not retry opening them on each reading
+    except OSError:
+        fd = None
+
+    # Another thread may have opened the same file meanwhile, keep only one descriptor
+    kept_fd = _SYS_FDS.setdefault(path, fd)
+    if fd is not None and kept_fd != fd:
+        os.close(fd)
+
+    return kept_fd
+
+
+def _pread_sys_file(path: str, size: int = 512) -> bytes | None:
+    """ This function will read a kernel info file from its start through its kept open descriptor"""
+
+    fd = _get_sys_fd(path)
+    if fd is None:
+        return None
+
+    try:
+        # The kernel regenerates the file content on each read at offset 0
+        return os.pread(fd, size, 0)
+
+    except OSError:
+        return None
+
 
 class Processor(ProcessorPyCore):
 
     def __init__(self):
         super(Processor, self).__init__(self)
 
-        # make lscpu result in text file
-        lscpu_file_path: str = f"{os.getcwd()}/lscpu_report.txt"
-        os.system(f"lscpu > {lscpu_file_path}")
+        # Check if the kernel cpu information file is present
+        if not os.path.exists(CPUINFO_PATH):
+            raise SystemDriverDoesntError(CPUINFO_PATH)
 
-        # Check if files are present
-        if not os.path.exists(lscpu_file_path):
-            raise SystemDriverDoesntError("lscpu")
+    @cached_property
+    def _proc_cpuinfo(self) -> dict:
+        """ This method will parse the first processor block of '/proc/cpuinfo' into a dict"""
 
-        # Read the 'cpuinfo' file
-        self.__lscpu_info = open(lscpu_file_path, 'r').read()
+        cpuinfo: dict = {}
 
-        # Delete lscpu result text file
-        subprocess.run(["rm", lscpu_file_path])
+        with open(CPUINFO_PATH, 'r') as file:
+            for line in file:
+
+                # The processors blocks are separated by an empty line
+                if not line.strip():
+                    if cpuinfo:
+                        break
+                    continue
+
+                key, _, value = line.partition(":")
+                cpuinfo[key.strip()] = value.strip()
+
+        return cpuinfo
+
+    @cached_property
+    def _packages_count(self) -> int:
+        """ This method will return the number of physical cpu packages from the distinct 'physical id' values"""
+
+        physical_ids: set = set()
+
+        with open(CPUINFO_PATH, 'r') as file:
+            for line in file:
+                if line.startswith("physical id"):
+                    physical_ids.add(line.partition(":")[2].strip())
+
+        return max(len(physical_ids), 1)
+
+    @cached_property
+    def _caches(self) -> dict:
+        """ This method will return the cpu caches sizes in kilobytes by their name 'L1d', 'L1i', 'L2', 'L3'"""
+
+        caches: dict = {}
+        cache_path: str = f"{CPU_SYSFS_PATH}/cache"
+
+        if not os.path.isdir(cache_path):
+            return caches
+
+        for index in os.listdir(cache_path):
+
+            if not index.startswith("index"):
+                continue
+
+            level = _read_sys_file(f"{cache_path}/{index}/level")
+            cache_type = _read_sys_file(f"{cache_path}/{index}/type")
+            size = _read_sys_file(f"{cache_path}/{index}/size")
+
+            if level is None or size is None:
+                continue
+
+            # Name the cache like lscpu does
+            suffix: str = {"Data": "d", "Instruction": "i"}.get(cache_type, "")
+            caches[f"L{level}{suffix}"] = int(size.rstrip("K"))
+
+        return caches
 
     @property
     def name(self) -> str:
         """ This method will return the cpu model name"""
-        return self.__get_text_info(r"Model name:")
+
+        name = self._proc_cpuinfo.get("model name") or self._proc_cpuinfo.get("Processor")
+        if name is not None:
+            return name
+
+        # The ARM64 kernels only give the implementer and part codes
+        part = self._proc_cpuinfo.get("CPU part")
+        return f"{self.manufacturer} {part}" if part is not None else None
 
     @property
     def manufacturer(self) -> str:
         """ This method will return the cpu manufacturer name"""
-        return self.__get_text_info(r"Vendor ID:")
+
+        vendor_id = self._proc_cpuinfo.get("vendor_id")
+        if vendor_id is not None:
+            return vendor_id
+
+        # Get the ARM implementer name from its code
+        implementer = self._proc_cpuinfo.get("CPU implementer")
+        if implementer is None:
+            return None
+
+        try:
+            return ARM_IMPLEMENTERS.get(int(implementer, 16), implementer)
+
+        except ValueError:
+            return implementer
 
     @property
     def architecture(self) -> str:
         """ This method will return the cpu arch"""
-        return self.__get_text_info(r"Architecture:")
+        return platform.machine()
 
     @property
     def family(self) -> str | None:
         """ This method will return the cpu family value"""
-        return self.__get_text_info(r"CPU family:")
+        return self._proc_cpuinfo.get("cpu family") or self._proc_cpuinfo.get("CPU architecture")
 
     # @property
     # def model(self) -> str | None:
     #     """ This method will return the cpu model value"""
-    #     return self.__get_text_info(r"Model:")
+    #     return self._proc_cpuinfo.get("model")
 
     def stepping(self) -> str | None:
         """ This method will return the cpu stepping value"""
-        return self.__get_text_info(r"Stepping:")
+        return self._proc_cpuinfo.get("stepping")
 
     def socket(self) -> str | None:
         """ This method will return the cpu socket"""
         return None    # This method isnt maintined yed it will be updated later
-    
+
     @property
     def flags(self) -> list | None:
         """ This method will return the cpu flags"""
-        return self.__get_text_info(r"Flags:").split()
+        # The ARM kernels name them 'Features'
+        flags = self._proc_cpuinfo.get("flags") or self._proc_cpuinfo.get("Features")
+        return flags.split() if flags is not None else None
 
     def l1_cache_size(self, friendly_format: bool = True) -> int | str | None:
         """ This method will return the level 1 cpu cache size"""
-        return self.__get_text_info(r"L1d cache:") if friendly_format else \
-            self._ProcessorPyCore__kilobytes_to_bytes(
-                self.__get_text_info(r"L1d cache:").split()[0])
+        return self.__get_cache_size("L1d", friendly_format)
 
     def l2_cache_size(self, friendly_format: bool = True) -> int | str | None:
         """ This method will return the level 2 cpu cache size"""
-        return self.__get_text_info(r"L2 cache:") if friendly_format else \
-            self._ProcessorPyCore__kilobytes_to_bytes(
-                self.__get_text_info(r"L2 cache:").split()[0])
+        return self.__get_cache_size("L2", friendly_format)
 
     def l3_cache_size(self, friendly_format: bool = True) -> int | str | None:
         """ This method will return the level 3 cpu cache size"""
-        return self.__get_text_info(r"L3 cache:") if friendly_format else \
-            self._ProcessorPyCore__kilobytes_to_bytes(
-                self.__get_text_info(r"L3 cache:").split()[0])
+        return self.__get_cache_size("L3", friendly_format)
 
-    def max_clock_speed(self) -> str | None:
+    def max_clock_speed(self) -> float | None:
         """ This method will return the maximum cpu clock speed"""
 
-        if self.__get_text_info(r"CPU MHz:") is None:
-
-            try:
-                # Execute the command and get the output
-                output = subprocess.check_output("cat /proc/cpuinfo | grep 'cpu MHz'", shell=True, text=True)
-                
-                # Extract the maximum clock speed from the output
-                max_speed = 0.0
-                for line in output.split('\n'):
-                    if "cpu MHz" in line:
-                        speed = float(line.split(':')[-1].strip())
-                        if speed > max_speed:
-                            max_speed = speed
-                return max_speed if max_speed > 0 else None
-            except subprocess.CalledProcessError as e:
-                return None
+        # Get the max frequency from cpufreq in khz
+        max_frequency = _read_sys_file(f"{CPU_SYSFS_PATH}/cpufreq/cpuinfo_max_freq")
+        if max_frequency is not None:
+            return int(max_frequency) / 1000
+
+        # Otherwise get the highest 'cpu MHz' value of all processors
+        max_speed = 0.0
+        with open(CPUINFO_PATH, 'r') as file:
+            for line in file:
+                if line.startswith("cpu MHz"):
+                    max_speed = max(max_speed, float(line.partition(":")[2]))
+
+        return max_speed if max_speed > 0 else None
 
     # def is_turbo_boosted(self) -> bool | None:
     #     """ This method will determine if the cpu is turbo boosted feature"""
@@ -122,158 +262,151 @@ class Processor(ProcessorPyCore):
     def is_support_virtualization(self) -> bool:
         """ This method will return if the cpu support virtualization technology or not"""
 
-        # Define hypervisors flags for each cpu manufacturer
-        virtualization_detect_patterns = {
-            "AMD": {
-                "flag": "hypervisor",
-                "virtualization": "AMD-V"
-            },
+        flags = self.flags
+        if flags is None:
+            return False
 
-            "Intel": {
-                "flag": "",
-                "virtualization": ""
-            },
+        return not VIRTUALIZATION_FLAGS.isdisjoint(flags)
 
-            "ARM": {
-                "flag": None,
-                "virtualization": None
-            }
+    def core_count(self, logical: bool = False) -> int | None:
+        """ This method will return the physical cores count or the logical processors count"""
 
-        }
+        # Get the threads or the cores count per package
+        per_package = self._proc_cpuinfo.get("siblings" if logical else "cpu cores")
 
-        # Figure out the cpu manufacturer
-        search_match = re.search(r"Intel|AMD", self.manufacturer)
+        # Otherwise every processor is counted as a core, like on ARM
+        if per_package is None:
+            return cpu_count()
 
-        cpu_manufacturer = search_match.group()
+        return int(per_package) * self._packages_count
 
-        # Check the virtualization type
-        if self.__get_text_info(r"Virtualization type:") == "full":
-            # Clear memory
-            del virtualization_detect_patterns, search_match, cpu_manufacturer
+    def __get_cache_size(self, cache_name: str, friendly_format: bool) -> int | str | None:
+        """ This method will return the given cache size in bytes or as friendly string"""
 
-            return True
+        size = self._caches.get(cache_name)
+        if size is None:
+            return None
 
-        # Check if there is a hypervisor vendor column
-        if self.__get_text_info(r"Hypervisor vendor:"):
-            # Clear memory
-            del virtualization_detect_patterns, search_match, cpu_manufacturer
+        if not friendly_format:
+            return self._ProcessorPyCore__kilobytes_to_bytes(size)
 
-            return True
+        return f"{size // 1024} MiB" if size >= 1024 and size % 1024 == 0 else f"{size} KiB"
 
-        # Check for virtualization column
-        if (self.__get_text_info(r"Virtualization:") ==
-                virtualization_detect_patterns[cpu_manufacturer]["virtualization"]):
-            # Clear memory
-            del virtualization_detect_patterns, search_match, cpu_manufacturer
 
-            return True
+class Sensors(ProcessorPyCore):
 
-        # Check if the virtualization flag exists in flag list
-        if virtualization_detect_patterns[cpu_manufacturer]["flag"] in self.flags:
-            # Clear memory
-            del virtualization_detect_patterns, search_match, cpu_manufacturer
+    def __init__(self):
+        super(Sensors, self).__init__(self)
 
-            return True
+    @cached_property
+    def max_clock_speed(self) -> float | None:
+        """ This method will return the maximum cpu clock speed, it's read once at the first use"""
+        return Processor().max_clock_speed()
 
-        # Clear memory
-        del virtualization_detect_patterns, search_match, cpu_manufacturer
+    @cached_property
+    def _base_clock_speed(self) -> float | None:
+        """ This method will return the cpu base clock speed which the MPERF counter is ticking at"""
 
-        # Return false if no of previous checks is True
-        return False
+        # Get the base frequency from cpufreq in khz, without it the counters can't be scaled
+        base_frequency = _read_sys_file(f"{CPU_SYSFS_PATH}/cpufreq/base_frequency")
+        return int(base_frequency) / 1000 if base_frequency is not None else None
 
-    def core_count(self, logical: bool = False) -> int | None:
+    def get_cpu_clock_speed(self) -> float | None:
+        """ This method will return th current cpu clock speed"""
 
-        if logical:
-            # Get number of threads per core
-            thread_per_core = self.__get_text_info(search_pattern=r"^Thread\(s\)\s+per\s+core:\s+(\d+)",
-                                                   pattern_text=r"Thread\(s\)s+per\s+core:",
-                                                   re_search_method=re.MULTILINE)
+        # Get the actual running frequency from the APERF/MPERF counters when they are readable
+        clock_speed = self.__get_msr_clock_speed()
+        if clock_speed is not None:
+            return clock_speed
 
-            # Get the thread per core number
-            thread_per_core = [char for char in thread_per_core if char.isdigit()]
-            # Return the all threads count
-            return int(''.join(thread_per_core)) * cpu_count() if thread_per_core is not None else None
+        # Get the current frequency from cpufreq in khz
+        current_frequency = _pread_sys_file(f"{CPU_SYSFS_PATH}/cpufreq/scaling_cur_freq")
+        if current_frequency:
+            return int(current_frequency) / 1000
 
-        elif not logical:
-            return cpu_count()
+        # Otherwise get the first processor current 'cpu MHz' value
+        with open(CPUINFO_PATH, 'r') as file:
+            for line in file:
+                if line.startswith("cpu MHz"):
+                    return float(line.partition(":")[2])
 
-    def __get_text_info(self, search_pattern: str,
-                        file: str = None,
-                        pattern_text: str = None,
-                        re_search_method: re.RegexFlag = re.IGNORECASE,
-                        text_clear: bool = True) -> str | None:
-        """ This method will search through the given file using a search pattern and return the extracted info """
+        return None
 
-        # Define empty variable to store extracted text
-        text: str = ""
+    @staticmethod
+    def get_cpu_usage() -> float | None:
+        """ This method will return the current cpu load percentage"""
 
-        # Check file parameter
-        if file is None:
-            file = self.__lscpu_info
+        # Take the initial reading
+        prev_times = Sensors.__get_cpu_times()
 
-        # Search through the file using search patterns
-        search_match = re.search(search_pattern, file, re_search_method)
-        if search_match:
+        # Sleep for the specified interval
+        time.sleep(0.1)
 
-            # Get the line searched column
-            start_index = search_match.start()
+        # Take the second reading
+        times = Sensors.__get_cpu_times()
 
-            for char in file[start_index:start_index + 500]:
+        if prev_times is None or times is None:
+            return None
 
-                if char == "\n":
-                    break
+        # Calculate the CPU usage
+        idle_delta = times[0] - prev_times[0]
+        total_delta = times[1] - prev_times[1]
 
-                text = text + char
+        if total_delta == 0:
+            return 0
 
-            # Clear extracted text from search pattern
-            if text_clear:
-                if pattern_text is None:
-                    pattern_text = search_pattern
+        return int(100 * (1 - (idle_delta / total_delta)))
 
-                text = re.sub(pattern_text, "", text)
+    def get_cpu_voltage(self, friendly_format: bool = True) -> int | str | None:
+        """ This method will return the cpu voltage value"""
+        return None     # This method is not maintained, yet it will be updated in recent versions
 
-            # Clear memory
-            del start_index, char, file, search_match, text_clear, pattern_text
+    def __get_msr_clock_speed(self) -> float | None:
+        """ This method will compute the actual cpu clock speed from the APERF/MPERF counters deltas"""
 
-        return text.lstrip(" ") if text != "" else None
+        # Without the base clock speed the counters can't be scaled, don't read them for nothing
+        if self._base_clock_speed is None:
+            return None
 
+        # The 'msr' module isn't loaded or it requires root privileges
+        msr_fd = _get_sys_fd(CPU_MSR_PATH)
+        if msr_fd is None:
+            return None
 
-class Sensors(ProcessorPyCore):
+        try:
+            prev_aperf = int.from_bytes(os.pread(msr_fd, 8, IA32_APERF), "little")
+            prev_mperf = int.from_bytes(os.pread(msr_fd, 8, IA32_MPERF), "little")
 
-    def __init__(self):
-        super(Sensors, self).__init__(self)
+            time.sleep(0.01)
 
-        # Define the max clock speed
-        self.__max_clock_speed = float(Processor().max_clock_speed())
+            aperf = int.from_bytes(os.pread(msr_fd, 8, IA32_APERF), "little")
+            mperf = int.from_bytes(os.pread(msr_fd, 8, IA32_MPERF), "little")
 
-    def get_cpu_clock_speed(self) -> float | None:
-        """ This method will return th current cpu clock speed"""
-        current_cpu_percent = self.get_cpu_usage()
-        return (current_cpu_percent / 100.0) * self.__max_clock_speed if current_cpu_percent is not None else None
+        except OSError:
+            return None
 
-    @staticmethod
-    def get_cpu_usage() -> float | None:
-        """ This method will return the current cpu load percentage"""
+        mperf_delta = mperf - prev_mperf
+        if mperf_delta <= 0:
+            return None
 
-        try:
-            # Run top command and capture output
-            output = subprocess.check_output(['top', '-bn', '1'], universal_newlines=True)
+        return round(self._base_clock_speed * (aperf - prev_aperf) / mperf_delta, 2)
 
-            # Extract CPU usage from the output using regular expressions
-            cpu_usage_match = re.search(r'%Cpu\(s\):\s+(\d+\.\d+)\s+us', output)
+    @staticmethod
+    def __get_cpu_times() -> tuple | None:
+        """ This method will return the idle and total cpu times from the first line of '/proc/stat'"""
 
-            if cpu_usage_match:
-                return ceil(float(cpu_usage_match.group(1)))
+        stat = _pread_sys_file(STAT_PATH)
+        if not stat:
+            return None
 
-            else:
-                return None
+        try:
+            cpu_times = [int(value) for value in stat.partition(b"\n")[0].split()[1:]]
 
-        except subprocess.CalledProcessError:
+        except ValueError:
             return None
 
-    def get_cpu_voltage(self, friendly_format: bool = True) -> int | str | None:
-        """ This method will return the cpu voltage value"""
-        return None     # This method is not maintained, yet it will be updated in recent versions
+        # The idle time is the 'idle' and 'iowait' columns, the guest columns are already counted in 'user'
+        return cpu_times[3] + cpu_times[4], sum(cpu_times[:8])
 
 
 if __name__ == "__main__":
@@ -8,14 +8,21 @@ license : MIT
 
 # IMPORTS
 import sys
-import csv
 import os
 import platform
-from math import ceil
-from multiprocessing import cpu_count
-from datetime import datetime
+from os import cpu_count
+from time import strftime
+from functools import cached_property
 
 __version__ = "1.0"
+__version_tuple__ = tuple(int(x) for x in __version__.split("."))
+
+# Get the usable logical processors count once, it respects the process affinity on Linux,
+# 'sched_getaffinity' doesn't exist on Windows which always falls back to the system processors count
+try:
+    _CPU_COUNT: int = len(os.sched_getaffinity(0))
+except AttributeError:
+    _CPU_COUNT: int = cpu_count() or 1
 
 
 class ProcessorPyCore:
@@ -26,22 +33,33 @@ class ProcessorPyCore:
     @staticmethod
     def __kilobytes_to_bytes(value: str) -> int | None:
         """ This method will convert kb to bytes"""
-        return ceil(int(value) * 1024) if value is not None else None
+        return int(value) * 1024 if value is not None else None
 
     @staticmethod
     def __megabytes_to_bytes(value: str) -> int | None:
         """ This method will convert mb to bytes"""
-        return ceil(int(value) * 10485761) if value is not None else None
+        return int(value) * 10485761 if value is not None else None
 
     @staticmethod
     def __megahertz_to_gigahertz(value: int) -> int | None:
         """ This method will convert mhz to ghz"""
-        return ceil(value / 1000) if value is not None else None
+        return (value + 999) // 1000 if value is not None else None
 
     @staticmethod
     def __kilobytes_to_megabytes(value: int) -> int | None:
         """ This method will convert kb to mb"""
-        return ceil(value / 1024) if value is not None else None
+        return (value + 1023) // 1024 if value is not None else None
+
+    @staticmethod
+    def __csv_escape(value) -> str:
+        """ This method will convert a value to a csv field and quote it only when it's needed"""
+
+        value: str = "" if value is None else str(value)
+
+        if any(char in value for char in ',"\r\n'):
+            return '"' + value.replace('"', '""') + '"'
+
+        return value
 
     def get_text_report(self, file_path: str = os.getcwd(), filename: str = "cpu-report.txt"):
         """ This method will export a text file report about the cpu"""
@@ -51,58 +69,44 @@ class ProcessorPyCore:
         # Format the dictionary to make it readable
         max_key_length: int = max(len(str(key)) for key in cpu_info_dict.keys())
         max_value_length: int = max(len(str(value)) for value in cpu_info_dict.values())
-        formatted_string: str = ""
+        rows: list = []
 
-        with open(f"{file_path}/{filename}", 'w') as file:
+        for key, value in cpu_info_dict.items():
 
-            for key, value in cpu_info_dict.items():
+            # Get the reformatted key and pad the columns
+            key: str = self._report_labels[key]
 
-                # Reformat the key
-                key: str = key.title().replace('_', ' ')
+            rows.append(f"{(key + ' :').ljust(max_key_length + 2)}         {str(value).ljust(max_value_length)}\n")
 
-                key_padding: str = " " * (max_key_length - len(str(key)))
-                value_padding: str = " " * (max_value_length - len(str(value)))
+        formatted_string: str = "".join(rows)
+        print(formatted_string)
 
-                formatted_string += f"{str(key)} :{key_padding}         {str(value)}{value_padding}\n"
+        # Write the whole report at once encoded in one pass, keeping the platform line endings
+        with open(f"{file_path}/{filename}", 'wb') as file:
+            file.write(formatted_string.replace("\n", os.linesep).encode("utf-8"))
 
-            # Clear memory
-            del (key_padding, value_padding, key, value, max_key_length,
-                 max_value_length, cpu_info_dict)
-
-            print(formatted_string)
-            for row in formatted_string:
-                file.write(row)
-
-            file.close()
-
-            # Clear memory
-            del row, formatted_string, file
-
-            # Return file report path
-            return f"{file_path}/{filename}"
+        # Return file report path
+        return f"{file_path}/{filename}"
 
     def get_csv_report(self, file_path: str = os.getcwd(), filename: str = "cpu-report.csv"):
         """ This method will export a csv file report about the cpu"""
 
         cpu_info_dict: dict = self.get_cpu_info()
 
-        with open(f"{file_path}/{filename}", 'w') as file:
-            writer = csv.writer(file)
-            writer.writerow(["key", "value"])   # Write Header row
+        # Build the rows of the known two columns schema directly, the header row comes first
+        rows: list = ["key,value"]
+        rows.extend(f"{key},{self.__csv_escape(value)}" for key, value in cpu_info_dict.items())
 
-            for key, value in cpu_info_dict.items():
-                writer.writerow([key, value])
-
-            file.close()
-
-            # Clear memory
-            del cpu_info_dict, writer, key, value, file
+        # Write the whole report at once with the same line terminator as the csv module
+        with open(f"{file_path}/{filename}", 'wb') as file:
+            file.write(("\r\n".join(rows) + "\r\n").encode("utf-8"))
 
         # Return the file report path
         return f"{file_path}/{filename}"
 
-    def get_cpu_info(self) -> dict:
-        """ This method will return all cpu information in a dit"""
+    @cached_property
+    def _cpu_info(self) -> dict:
+        """ This method will get the static cpu information once at the first use"""
         return {
             # "operating_system": platform.freedesktop_os_release()["PRETTY_NAME"],
             "cpu_name": self.__processor_object.name,
@@ -120,9 +124,21 @@ class ProcessorPyCore:
             "is_support_virtualization": self.__processor_object.is_support_virtualization(),
             "cpu_cores": self.__processor_object.core_count(),
             "cpu_threads": self.__processor_object.core_count(logical=True),
-            "report_date": datetime.now().strftime("%d/%m/%Y %H:%M")
         }
 
+    @cached_property
+    def _report_labels(self) -> dict:
+        """ This method will reformat the cpu information keys into the text report labels once"""
+        return {key: key.title().replace('_', ' ') for key in self.get_cpu_info()}
+
+    def get_cpu_info(self) -> dict:
+        """ This method will return all cpu information in a dit"""
+
+        # Copy the cached flags list too, the caller may change the returned dict values
+        flags = self._cpu_info["flags"]
+        return {**self._cpu_info, "flags": list(flags) if flags is not None else None,
+                "report_date": strftime("%d/%m/%Y %H:%M")}
+
 
     @property
     def version_string(self) -> str:
@@ -132,29 +148,40 @@ class ProcessorPyCore:
     @property
     def version_tuple(self) -> tuple:
         # This method will return the ProcessorPy version in tuple
-        return tuple(__version__.replace('.', ' ').split())
+        return __version_tuple__
 
 
 class ProcessorPyResult(tuple):
 
-    def __new__(cls, *args):
-        if len(args[0]) != len(cls._fields):
-            raise TypeError(f'{cls.__name__} takes {len(cls._fields)} arguments ({len(args[0])} given)')
-        return super(ProcessorPyResult, cls).__new__(cls, args[0])
+    _fields: tuple = ()
+    _field_index: dict = {}
+    _size: int = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Map each field name to its index once to get attributes in constant time
+        cls._field_index = {name: idx for idx, name in enumerate(cls._fields)}
+        cls._size = len(cls._fields)
+
+    def __new__(cls, values):
+        result = super(ProcessorPyResult, cls).__new__(cls, values)
+        if len(result) != cls._size:
+            raise TypeError(f'{cls.__name__} takes {cls._size} arguments ({len(result)} given)')
+        return result
 
     def __repr__(self):
         return f'{self.__class__.__name__}({", ".join(f"{name}={val}" for name, val in zip(self._fields, self))})'
 
     def __getattr__(self, name):
         try:
-            idx = self._fields.index(name)
+            idx = self._field_index[name]
             return self[idx]
-        except ValueError:
+        except KeyError:
             raise AttributeError(f'{self.__class__.__name__} object has no attribute "{name}"')
 
     @classmethod
     def _make(cls, iterable):
-        return cls(*iterable)
+        return cls(iterable)
 
     def _asdict(self):
         return {name: val for name, val in zip(self._fields, self)}
@@ -162,11 +189,11 @@ class ProcessorPyResult(tuple):
     def _replace(self, **kwargs):
         current_fields = self._fields
         args = [kwargs[field] if field in kwargs else getattr(self, field) for field in current_fields]
-        return self.__class__(*args)
+        return self.__class__(args)
 
 
 class SensorsResult(ProcessorPyResult):
-    _fields = tuple(f"core{x}" for x in range(cpu_count())) + ('total',)
+    _fields = tuple(f"core{x}" for x in range(_CPU_COUNT)) + ('total',)
 
 
 if __name__ == "__main__":
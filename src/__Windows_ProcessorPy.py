@@ -16,16 +16,72 @@ sources :
 
 # IMPORTS
 
-from threading import Thread
-from __ProcessorPy_core import ProcessorPyCore, ProcessorPyResult, SensorsResult
+from threading import Lock
+from functools import cached_property, lru_cache
+from __ProcessorPy_core import ProcessorPyCore, ProcessorPyResult, SensorsResult, _CPU_COUNT
 from time import sleep
 import ctypes
+from ctypes import wintypes
 import sys
 import subprocess
 import platform
+import json
+
+# Define the powershell script which emits all the Win32_Processor properties as one json object
+_PS_SCRIPT: str = "Get-CimInstance -ClassName Win32_Processor | " \
+                  "Select-Object -Property * -ExcludeProperty Cim* | ConvertTo-Json -Compress"
+
+# Define the NtQuerySystemInformation class to get the processors performance information
+SYSTEM_PROCESSOR_PERFORMANCE_INFORMATION_CLASS: int = 8
+
+# Define the NTSTATUS returned when the given buffer is too small for the information
+STATUS_INFO_LENGTH_MISMATCH: int = 0xC0000004
+
+
+class SYSTEM_PROCESSOR_PERFORMANCE_INFORMATION(ctypes.Structure):
+    """ This structure describes the times of a logical processor"""
+
+    _fields_ = [
+        ("IdleTime", ctypes.c_longlong),
+        ("KernelTime", ctypes.c_longlong),
+        ("UserTime", ctypes.c_longlong),
+        ("DpcTime", ctypes.c_longlong),
+        ("InterruptTime", ctypes.c_longlong),
+        ("InterruptCount", ctypes.c_ulong),
+    ]
+
+
+# Define the sensors native functions prototypes once, to not let ctypes guess the arguments on each reading
+_GetSystemTimes = ctypes.windll.kernel32.GetSystemTimes
+_GetSystemTimes.argtypes = [ctypes.POINTER(ctypes.c_ulonglong)] * 3
+_GetSystemTimes.restype = wintypes.BOOL
+
+_NtQuerySystemInformation = ctypes.windll.ntdll.NtQuerySystemInformation
+_NtQuerySystemInformation.argtypes = [wintypes.ULONG, ctypes.c_void_p, wintypes.ULONG, ctypes.POINTER(wintypes.ULONG)]
+_NtQuerySystemInformation.restype = wintypes.LONG
+
+
+@lru_cache(maxsize=None)
+def _get_sensors_result_class(cores_count: int) -> type:
+    """ This function will return the SensorsResult class which holds the given cores count readings"""
+
+    if cores_count == len(SensorsResult._fields) - 1:
+        return SensorsResult
+
+    # The processors group of the calling thread can hold fewer processors than the whole system
+    return type("SensorsResult", (SensorsResult,),
+                {"_fields": tuple(f"core{x}" for x in range(cores_count)) + ('total',)})
+
 
 class Processor(ProcessorPyCore):
 
+    # The machine architecture doesn't change, get it once
+    __architecture: str = platform.machine()
+
+    # Define the Win32_Processor properties cache, it's shared by all the instances and filled at the first query
+    __wmi_cache: dict | None = None
+    __wmi_lock = Lock()
+
     def __init__(self):
         super(Processor, self).__init__(self)
 
@@ -45,7 +101,7 @@ class Processor(ProcessorPyCore):
     @property
     def architecture(self) -> str:
         """ This method will return the cpu arch"""
-        return platform.machine()
+        return self.__architecture
 
     @property
     def family(self) -> str | None:
@@ -85,55 +141,67 @@ class Processor(ProcessorPyCore):
     def max_clock_speed(self, friendly_format: bool = True) -> str | int | None:
         """ This method will return the maximum cpu clock speed"""
 
-        try:
-            # Run the command to get CPU information
-            output = subprocess.check_output("wmic cpu get CurrentClockSpeed /value", shell=True).decode()
-
-            # Process the output to extract the clock speed value
-            for line in output.splitlines():
-
-                if line.startswith("CurrentClockSpeed"):
-                    # Extract the value after the '=' sign
-                    return int(line.split('=')[1].strip()) if not friendly_format else \
-                        f'{self._ProcessorPyCore__megahertz_to_gigahertz(int(line.split('=')[1].strip()))} Ghz'
-
-        except subprocess.SubprocessError:
+        max_clock_speed = self.__get_win32_processor_info("MaxClockSpeed")
+        if max_clock_speed is None:
             return None
 
+        return int(max_clock_speed) if not friendly_format else \
+            f"{self._ProcessorPyCore__megahertz_to_gigahertz(int(max_clock_speed))} Ghz"
+
     # def is_turbo_boosted(self) -> bool | None:
     #     """ This method will determine if the cpu is turbo boosted feature"""
 
     def is_support_virtualization(self) -> bool | None:
         """ This method will return if the cpu support virtualization technology or not"""
-        return True if self.__get_win32_processor_info("VirtualizationFirmwareEnabled") == " True" else False
+        return self._wmi_property("VirtualizationFirmwareEnabled") is True
 
     def core_count(self, logical: bool = False) -> int:
         """ This method will return the cpu cores and treads count number"""
 
-        return self.__get_win32_processor_info("ThreadCount") if logical else \
+        return int(self.__get_win32_processor_info("ThreadCount")) if logical else \
             int(self.__get_win32_processor_info("NumberOfCores"))
 
+    def __load_wmi(self) -> dict:
+        """ This method will get all the Win32_Processor properties in one powershell call per process and cache them"""
+
+        with Processor.__wmi_lock:
+
+            if Processor.__wmi_cache is not None:
+                return Processor.__wmi_cache
+
+            _process_output = subprocess.check_output([self.__powershell_path, "-NoProfile", "-NonInteractive",
+                                                       "-Command", _PS_SCRIPT],
+                                                      text=True, creationflags=subprocess.CREATE_NO_WINDOW)
+            processor_info = json.loads(_process_output)
+
+            # Multi sockets systems will return a list of processors, take the first one
+            Processor.__wmi_cache = processor_info[0] if isinstance(processor_info, list) else processor_info
+
+        return Processor.__wmi_cache
+
+    def _wmi_property(self, name: str):
+        """ This method will return the raw value of the given cached Win32_Processor property"""
+        return self.__load_wmi().get(name)
+
     def __get_win32_processor_info(self, query: str) -> str | None:
-        """ This method will make a command in powershell to get the cpu info"""
+        """ This method will return the cpu info from the cached Win32_Processor properties"""
 
-        _process_output = subprocess.check_output([self.__powershell_path, "Get-WmiObject", "-Class", "Win32_Processor",
-                                                   "-ComputerName.", "|", "Select-Object", "-Property", query],
-                                                  text=True, creationflags=subprocess.CREATE_NO_WINDOW).split()
-        # Remove query from output
-        _process_output.remove(query)
-        return ' '.join(_process_output).strip('-') if len(_process_output) > 1 else None
+        value = self._wmi_property(query)
+        return str(value) if value is not None else None
 
 
 class Sensors(ProcessorPyCore):
 
-    __max_clock_speed: int
-
     def __init__(self):
         super(Sensors, self).__init__(Processor)
 
-        # Get powershell path
-        self.__powershell_path = "C:\\Windows\\System32\\WindowsPowershell\\v1.0\\powershell.exe"
-        self.max_clock_speed: int = Processor().max_clock_speed(friendly_format=False)
+        # Get the processor to read the shared Win32_Processor properties
+        self.__processor = Processor()
+
+    @cached_property
+    def max_clock_speed(self) -> int | None:
+        """ This method will return the maximum cpu clock speed, it's read once at the first use"""
+        return self.__processor.max_clock_speed(friendly_format=False)
 
     def get_cpu_clock_speed(self) -> float | None:
         """ This method will return the current cpu clock frequency"""
@@ -147,44 +215,34 @@ class Sensors(ProcessorPyCore):
 
         if per_core:
 
-            # Get process output
-            _process_output = subprocess.check_output([self.__powershell_path, 'Get-CimInstance', '-Query', '"select',
-                                                       'Name,', 'PercentProcessorTime', 'from',
-                                                       'Win32_PerfFormattedData_PerfOS_Processor"', '|', 'Select',
-                                                       'Name,',
-                                                       'PercentProcessorTime'],
-                                                      text=True,
-                                                      creationflags=subprocess.CREATE_NO_WINDOW).replace('-', '').split()
+            # Take the initial reading
+            prev_times = self.__get_processors_times()
 
-            # Remove unwanted items
-            _process_output.remove("Name")
-            _process_output.remove("PercentProcessorTime")
+            # Sleep for the specified interval
+            sleep(0.1)
 
-            # THIS SECTION WILL GET THE CPU USAGE PERCENTAGE FOR EACH CORE
+            # Take the second reading
+            times = self.__get_processors_times()
 
-            # Get cores usage percentage in tuple
-            core_usage_percentage = []
-            value_gotten = False
-            for _ in _process_output:
+            # THIS SECTION WILL GET THE CPU USAGE PERCENTAGE FOR EACH CORE IN ONE PASS
+            core_usage_percentage: list = []
+            idle_sum: int = 0
+            total_sum: int = 0
 
-                if _ == "_Total":
-                    core_usage_percentage.append(_process_output[_process_output.index('_Total') + 1])
-                    break
+            for (idle, total), (prev_idle, prev_total) in zip(times, prev_times):
+                idle_delta = idle - prev_idle
+                total_delta = total - prev_total
 
-                if value_gotten:
-                    value_gotten = False
-                    continue
+                core_usage_percentage.append(100 * (total_delta - idle_delta) // total_delta if total_delta else 0)
+                idle_sum += idle_delta
+                total_sum += total_delta
 
-                elif not value_gotten:
-                    core_usage_percentage.append(_process_output[_process_output.index(_) + 1])
-                    value_gotten = True
+            # Calculate the total CPU usage from all the cores
+            total_usage = 100 * (total_sum - idle_sum) // total_sum if total_sum else 0
 
             # Set result to the SensorsResult class
-            cpu_usage = SensorsResult(tuple(x for x in core_usage_percentage))
-
-            # Clear memory
-            del core_usage_percentage, value_gotten, _, _process_output
-            # return the result
+            cpu_usage = _get_sensors_result_class(len(core_usage_percentage))(
+                tuple(core_usage_percentage) + (total_usage,))
             return cpu_usage
 
         elif not per_core:
@@ -211,15 +269,13 @@ class Sensors(ProcessorPyCore):
     def get_cpu_voltage(self, friendly_format: bool = True) -> int | str | None:
         """ This method will return the cpu voltage value"""
 
-        # Get voltage using WMIC API
-        _process_output = subprocess.check_output(["WMIC", "CPU", "GET", "CurrentVoltage"],
-                                                  text=True, creationflags=subprocess.CREATE_NO_WINDOW).split()
-
-        _process_output.remove("CurrentVoltage")
-        if len(_process_output) < 0:
+        # Get voltage from the cached Win32_Processor properties, it's treated as static since
+        # Win32_Processor fills CurrentVoltage from the SMBIOS processor table and not from a live sensor
+        current_voltage = self.__processor._wmi_property("CurrentVoltage")
+        if current_voltage is None:
             return None
 
-        return self.__adjust_voltage_string(int(_process_output[0])) if friendly_format else int(_process_output[0])
+        return self.__adjust_voltage_string(int(current_voltage)) if friendly_format else int(current_voltage)
 
     @staticmethod
     def __adjust_voltage_string(value: int) -> str:
@@ -232,7 +288,7 @@ class Sensors(ProcessorPyCore):
         kernel_time = ctypes.c_ulonglong()
         user_time = ctypes.c_ulonglong()
 
-        if not ctypes.windll.kernel32.GetSystemTimes(
+        if not _GetSystemTimes(
                 ctypes.byref(idle_time),
                 ctypes.byref(kernel_time),
                 ctypes.byref(user_time)
@@ -241,6 +297,39 @@ class Sensors(ProcessorPyCore):
 
         return idle_time.value, kernel_time.value + user_time.value
 
+    @staticmethod
+    def __get_processors_times() -> list:
+        """ This method will return the idle and total times of each logical processor"""
+
+        # Start with the system processors count, the returned processors group may be smaller or bigger
+        processors_count: int = _CPU_COUNT
+
+        while True:
+            processors_info = (SYSTEM_PROCESSOR_PERFORMANCE_INFORMATION * processors_count)()
+            return_length = wintypes.ULONG()
+
+            status: int = _NtQuerySystemInformation(
+                SYSTEM_PROCESSOR_PERFORMANCE_INFORMATION_CLASS,
+                ctypes.byref(processors_info),
+                ctypes.sizeof(processors_info),
+                ctypes.byref(return_length)
+            ) & 0xFFFFFFFF
+
+            if status != STATUS_INFO_LENGTH_MISMATCH:
+                break
+
+            # The buffer is too small, grow it to the needed size
+            processors_count = max(return_length.value // ctypes.sizeof(SYSTEM_PROCESSOR_PERFORMANCE_INFORMATION),
+                                   processors_count * 2)
+
+        if status != 0:
+            raise Exception("Failed to get processors times")
+
+        # The kernel time includes the idle time, only the returned processors are filled
+        return [(processor_info.IdleTime, processor_info.KernelTime + processor_info.UserTime)
+                for processor_info in processors_info[:return_length.value //
+                                                       ctypes.sizeof(SYSTEM_PROCESSOR_PERFORMANCE_INFORMATION)]]
+
 
 if __name__ == "__main__":
     sys.exit()